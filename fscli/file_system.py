@@ -8,12 +8,291 @@ import stat
 import time
 import re
 import sys
-from collections import namedtuple
+import concurrent.futures
+import errno
+import functools
+import itertools
+import string
+from collections import namedtuple, OrderedDict, deque
 try:
     import ctypes
-    import string
 except ImportError:
     pass  # Handle gracefully if not available
+try:
+    import mmap
+except ImportError:
+    mmap = None
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+# Platform facts are constant for the process lifetime, resolve them once
+_OS_TYPE = platform.system().lower()
+_IS_WINDOWS = _OS_TYPE == 'windows'
+_HAS_CTYPES = 'ctypes' in sys.modules
+
+if _IS_WINDOWS and _HAS_CTYPES:
+    _GetLogicalDrives = ctypes.windll.kernel32.GetLogicalDrives
+    _GetDriveTypeW = ctypes.windll.kernel32.GetDriveTypeW
+
+    from ctypes import wintypes
+    _GetVolumeInformationW = ctypes.windll.kernel32.GetVolumeInformationW
+    _GetVolumeInformationW.argtypes = [
+        wintypes.LPCWSTR, wintypes.LPWSTR, wintypes.DWORD, wintypes.LPDWORD,
+        wintypes.LPDWORD, wintypes.LPDWORD, wintypes.LPWSTR, wintypes.DWORD
+    ]
+    _GetVolumeInformationW.restype = wintypes.BOOL
+else:
+    _GetLogicalDrives = _GetDriveTypeW = _GetVolumeInformationW = None
+_HAS_STATVFS = hasattr(os, 'statvfs')
+
+# 0: Unknown, 1: No root dir, 2: Removable, 3: Fixed, 4: Remote, 5: CDROM, 6: RAMDisk
+_DRIVE_TYPES = {
+    0: "UNKNOWN", 1: "NO_ROOT_DIR", 2: "REMOVABLE",
+    3: "FIXED", 4: "REMOTE", 5: "CDROM", 6: "RAMDISK"
+}
+
+# Entry returned by FileSystem.list_all
+ListEntry = namedtuple('ListEntry', 'name type size modified')
+ListEntry.__new__.__defaults__ = (None, None)
+
+# Maximum number of paths kept in a FileSystem stat cache
+_STAT_CACHE_SIZE = 1024
+
+# Kernel-side file copies (Linux 4.5+)
+_HAS_COPY_FILE_RANGE = hasattr(os, 'copy_file_range')
+_COPY_RANGE_CHUNK = 1 << 30
+_COPY_RANGE_FALLBACK_ERRNOS = frozenset({
+    errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EBADF
+})
+
+# Pseudo filesystems and devices skipped unless all partitions are requested
+_SKIP_FSTYPES = frozenset({'proc', 'sysfs', 'devpts', 'devtmpfs', 'tmpfs'})
+_SKIP_DEVICE_PREFIXES = ('none', '/dev/loop', 'udev')
+
+# Symbolic 'rwxrwxrwx' strings for every 9-bit permission value
+_PERM_STRINGS = tuple(
+    ''.join('rwx'[i % 3] if n & (0o400 >> i) else '-' for i in range(9))
+    for n in range(0o1000)
+)
+# File type prefix for symbolic permissions, '-' for anything else
+_TYPE_CHARS = {stat.S_IFDIR: 'd', stat.S_IFLNK: 'l'}
+
+# Hash algorithms accepted by get_file_hash
+_HASH_TYPES = ('md5', 'sha1', 'sha256', 'sha512', 'blake2b', 'blake2s')
+
+# Optional fast hashes from third-party packages, registered when installed.
+# xxh3 is not cryptographic: use it for deduplication, not for evidence integrity.
+_FAST_HASHES = {}
+if blake3 is not None:
+    _FAST_HASHES['blake3'] = blake3.blake3
+if xxhash is not None:
+    _FAST_HASHES['xxh3'] = xxhash.xxh3_128
+_HAS_FILE_DIGEST = hasattr(hashlib, 'file_digest')
+
+# Files up to this size are hashed with a single read
+_SMALL_FILE_SIZE = 4 * 1024 * 1024
+# Minimum read buffer size for hashing larger files
+_HASH_BUFSIZE = 1024 * 1024
+
+# Before Python 3.11 (no hashlib.file_digest), files from this size on are
+# hashed through mmap (64-bit only, since large mappings can exhaust a 32-bit
+# address space). A file truncated while mapped kills the process with SIGBUS,
+# so this is only used for single files, never for whole trees.
+_HAS_MMAP = mmap is not None and sys.maxsize > 2 ** 32 and not _HAS_FILE_DIGEST
+_MMAP_THRESHOLD = 8 * 1024 * 1024
+_MMAP_WINDOW = 64 * 1024 * 1024
+
+# Files queued per hashing thread in FileSystem.iter_hash_files
+_HASH_WINDOW_FACTOR = 2
+
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+
+@functools.lru_cache(maxsize=4096)
+def _humanize(size, decimal_places):
+    """
+    Format a non-zero byte count with a binary unit suffix.
+
+    Args:
+        size (int): Size in bytes
+        decimal_places (int): Number of decimal places for rounding
+
+    Returns:
+        str: Human-readable size (e.g., '1.23 MB')
+    """
+    # Each unit step is 10 bits, so the bit length picks the unit directly
+    unit_index = min(max((int(size).bit_length() - 1) // 10, 0), len(_SIZE_UNITS) - 1)
+    return f"{size / (1 << (unit_index * 10)):.{decimal_places}f} {_SIZE_UNITS[unit_index]}"
+
+
+def _disk_usage(path):
+    """
+    Get total, used and free bytes for the filesystem containing a path.
+
+    Calls os.statvfs directly where available, with the same accounting as
+    shutil.disk_usage (free is the space available to unprivileged users).
+
+    Args:
+        path (str): Path on the filesystem
+
+    Returns:
+        tuple: (total, used, free) in bytes
+    """
+    if not _HAS_STATVFS:
+        return tuple(shutil.disk_usage(path))
+    st = os.statvfs(path)
+    frsize = st.f_frsize
+    return (st.f_blocks * frsize, (st.f_blocks - st.f_bfree) * frsize, st.f_bavail * frsize)
+
+
+def _get_volume_information(drive):
+    """
+    Get the volume name and filesystem type of a Windows drive.
+
+    Args:
+        drive (str): Drive letter with colon (e.g., 'C:')
+
+    Returns:
+        tuple: (volume_name, fs_type), or None if the call failed
+    """
+    volume_name = ctypes.create_unicode_buffer(261)
+    fs_name = ctypes.create_unicode_buffer(261)
+    if not _GetVolumeInformationW(f"{drive}\\", volume_name, len(volume_name),
+                                  None, None, None, fs_name, len(fs_name)):
+        return None
+    return volume_name.value, fs_name.value
+
+
+def _unescape_mount_field(field):
+    """
+    Decode the octal escapes (e.g., '\\040' for a space) used in mount tables.
+
+    Args:
+        field (str): Raw field from the mount table
+
+    Returns:
+        str: Decoded field
+    """
+    if '\\' not in field:
+        return field
+    return re.sub(r'\\([0-7]{3})', lambda m: chr(int(m.group(1), 8)), field)
+
+
+def _read_mountinfo(path='/proc/self/mountinfo'):
+    """
+    Read mounted filesystems from a Linux mountinfo file.
+
+    Args:
+        path (str): Path of the mountinfo file
+
+    Returns:
+        list: List of (device, mountpoint, fstype, opts) tuples
+    """
+    mounts = []
+    with open(path) as f:
+        for line in f:
+            # The optional fields before ' - ' vary in number, so split there
+            mount_fields, _, fs_fields = line.partition(' - ')
+            mount_fields = mount_fields.split()
+            fs_fields = fs_fields.split()
+            if len(mount_fields) < 6 or len(fs_fields) < 2:
+                continue
+            mounts.append((
+                _unescape_mount_field(fs_fields[1]),
+                _unescape_mount_field(mount_fields[4]),
+                fs_fields[0],
+                mount_fields[5]
+            ))
+    return mounts
+
+
+def _read_mount_command():
+    """
+    Read mounted filesystems from the output of the mount command.
+
+    Returns:
+        list: List of (device, mountpoint, fstype, opts) tuples
+    """
+    mount_output = subprocess.run(
+        ['mount'], stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+        universal_newlines=True, check=True
+    ).stdout
+
+    mounts = []
+    for line in mount_output.splitlines():
+        parts = line.split()
+        if len(parts) >= 6:
+            mounts.append((parts[0], parts[2], parts[4], parts[5].strip('()')))
+    return mounts
+
+
+def _copy_file_range(source, destination):
+    """
+    Copy the contents of a regular file with copy_file_range(2), so the data
+    never passes through user space.
+
+    Args:
+        source (str): Source file path
+        destination (str): Destination file path
+
+    Returns:
+        bool: True if the file was copied, False if the caller should fall back
+            to a regular copy
+    """
+    st = os.stat(source)
+    if not stat.S_ISREG(st.st_mode) or st.st_size == 0:
+        # Pseudo files such as /proc/cpuinfo report size 0, and copy_file_range
+        # copies nothing from them on some kernels; a read loop is needed there
+        return False
+    try:
+        if os.path.samestat(st, os.stat(destination)):
+            return False  # Leave shutil to report copying a file onto itself
+    except FileNotFoundError:
+        pass
+
+    copied = 0
+    with open(source, 'rb') as fsrc, open(destination, 'wb') as fdst:
+        try:
+            while True:
+                sent = os.copy_file_range(fsrc.fileno(), fdst.fileno(), _COPY_RANGE_CHUNK)
+                if not sent:
+                    break
+                copied += sent
+        except OSError as e:
+            # Cross-device copies, old kernels and unsupported filesystems
+            if e.errno in _COPY_RANGE_FALLBACK_ERRNOS:
+                return False
+            raise
+    # Some pseudo filesystems report a nonzero size that copy_file_range can't match
+    return copied == st.st_size
+
+
+def _digest_mmap(f, hash_obj):
+    """
+    Feed a file to a hash object through a read-only memory map.
+
+    Args:
+        f (file): File object opened in binary mode
+        hash_obj: Hash object exposing update()
+
+    Returns:
+        The updated hash object
+    """
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        size = len(mm)
+        with memoryview(mm) as view:
+            for offset in range(0, size, _MMAP_WINDOW):
+                hash_obj.update(view[offset:offset + _MMAP_WINDOW])
+    return hash_obj
 
 
 class FileSystem:
@@ -23,10 +302,92 @@ class FileSystem:
     filesystem types, and detailed system information.
     """
 
-    def __init__(self):
-        """Initialize the FileSystem class."""
+    def __init__(self, stat_cache=False):
+        """
+        Initialize the FileSystem class.
+
+        Args:
+            stat_cache (bool): If True, reuse os.stat results for up to half a
+                second across permission, size and listing queries, keeping the
+                most recent _STAT_CACHE_SIZE paths. Changes made
+                through this class invalidate the affected paths, but changes made
+                by other processes can be missed until the entry expires, so leave
+                this off when results must reflect the file at the time of the call.
+        """
         self.current_dir = os.getcwd()
-        self.os_type = platform.system().lower()
+        self.os_type = _OS_TYPE
+        self.stat_cache = stat_cache
+        self._stat_cache = OrderedDict()
+
+    def _stat(self, path, max_age=0.5):
+        """
+        Get os.stat results for a path, from the stat cache if enabled.
+
+        Args:
+            path (str): Path to stat
+            max_age (float): Maximum age in seconds of a cached result
+
+        Returns:
+            os.stat_result: Stat results for the path
+        """
+        if not self.stat_cache:
+            return os.stat(path)
+
+        key = self._abspath(path)
+        now = time.monotonic()
+        cached = self._stat_cache.get(key)
+        if cached is not None and now - cached[0] < max_age:
+            return cached[1]
+
+        st = os.stat(path)
+        self._cache_stat(key, st, now)
+        return st
+
+    def _cache_stat(self, key, st, now):
+        """
+        Store a stat result in the stat cache, evicting the oldest entry
+        once the cache is full.
+
+        Args:
+            key (str): Absolute path, as returned by _abspath
+            st (os.stat_result): Stat results for the path
+            now (float): time.monotonic() when the stat was taken
+        """
+        cache = self._stat_cache
+        # Re-insert so the entry moves to the young end
+        cache.pop(key, None)
+        cache[key] = (now, st)
+        if len(cache) > _STAT_CACHE_SIZE:
+            cache.popitem(last=False)
+
+    def _abspath(self, path):
+        """
+        Get the absolute, normalized form of a path.
+
+        Resolves relative paths against current_dir instead of calling
+        os.getcwd() like os.path.abspath does.
+
+        Args:
+            path (str): Path to resolve
+
+        Returns:
+            str: Absolute path
+        """
+        if not os.path.isabs(path):
+            path = os.path.join(self.current_dir, path)
+        return os.path.normpath(path)
+
+    def _invalidate_stat(self, *paths):
+        """
+        Drop cached stat results for the given paths.
+
+        Args:
+            *paths (str): Paths whose cached results are stale
+        """
+        if not self._stat_cache:
+            return
+        for path in paths:
+            self._stat_cache.pop(self._abspath(path), None)
 
     def _human_readable_size(self, size, decimal_places=2):
         """
@@ -41,13 +402,7 @@ class FileSystem:
         """
         if size == 0:
             return '0 B'
-        units = ['B', 'KB', 'MB', 'GB', 'TB', 'PB']
-        unit_index = 0
-        size = float(size)
-        while size >= 1024 and unit_index < len(units) - 1:
-            size /= 1024
-            unit_index += 1
-        return f"{size:.{decimal_places}f} {units[unit_index]}"
+        return _humanize(size, decimal_places)
 
     def create_file(self, path, content=""):
         """
@@ -61,6 +416,7 @@ class FileSystem:
             bool: True if successful, False otherwise
         """
         try:
+            self._invalidate_stat(path)
             with open(path, 'w') as f:
                 f.write(content)
             return True
@@ -76,11 +432,17 @@ class FileSystem:
             path (str): Path of the file to read
 
         Returns:
-            str: File content or empty string if error occurs
+            str: File content or empty string if error occurs. Content is
+                decoded as UTF-8, with undecodable bytes replaced, and line
+                endings are normalized to '\\n'.
         """
         try:
-            with open(path, 'r') as f:
-                return f.read()
+            # One sized read and one decode beat the incremental text layer
+            with open(path, 'rb') as f:
+                content = f.read().decode('utf-8', errors='replace')
+            if '\r' in content:
+                content = content.replace('\r\n', '\n').replace('\r', '\n')
+            return content
         except Exception as e:
             print(f"Error reading file: {e}")
             return ""
@@ -97,6 +459,7 @@ class FileSystem:
         """
         try:
             if os.path.isfile(path):
+                self._invalidate_stat(path)
                 os.remove(path)
                 return True
             else:
@@ -118,6 +481,7 @@ class FileSystem:
         """
         try:
             if not os.path.exists(path):
+                self._invalidate_stat(path)
                 os.makedirs(path)
                 return True
             else:
@@ -141,8 +505,10 @@ class FileSystem:
         try:
             if os.path.isdir(path):
                 if recursive:
+                    self._stat_cache.clear()
                     shutil.rmtree(path)
                 else:
+                    self._invalidate_stat(path)
                     os.rmdir(path)  # Will only work if directory is empty
                 return True
             else:
@@ -166,12 +532,8 @@ class FileSystem:
             if path is None:
                 path = self.current_dir
 
-            file_list = []
-            for item in os.listdir(path):
-                item_path = os.path.join(path, item)
-                if os.path.isfile(item_path):
-                    file_list.append(item)
-            return file_list
+            with os.scandir(path) as it:
+                return [entry.name for entry in it if entry.is_file()]
         except Exception as e:
             print(f"Error listing files: {e}")
             return []
@@ -190,12 +552,8 @@ class FileSystem:
             if path is None:
                 path = self.current_dir
 
-            folder_list = []
-            for item in os.listdir(path):
-                item_path = os.path.join(path, item)
-                if os.path.isdir(item_path):
-                    folder_list.append(item)
-            return folder_list
+            with os.scandir(path) as it:
+                return [entry.name for entry in it if entry.is_dir()]
         except Exception as e:
             print(f"Error listing folders: {e}")
             return []
@@ -209,37 +567,103 @@ class FileSystem:
             include_details (bool): If True, include file size, modification time
 
         Returns:
-            list: List of dictionaries with file/folder information
+            list: List of ListEntry tuples (name, type, size, modified); size and
+                modified are None unless details are requested, and size is None
+                for folders. Use ._asdict() for a dictionary. Empty if the
+                directory could not be read.
         """
         try:
-            if path is None:
-                path = self.current_dir
+            return list(self._scan_entries(path, include_details))
+        except Exception as e:
+            print(f"Error listing items: {e}")
+            return []
 
-            items = []
-            for item in os.listdir(path):
-                item_path = os.path.join(path, item)
+    def iter_all(self, path=None, include_details=False):
+        """
+        Yield the files and folders in a directory one at a time, as list_all
+        does but without building the whole list. If reading the directory
+        fails partway, the error is printed and iteration stops.
 
-                if include_details:
-                    stats = os.stat(item_path)
-                    modified_time = datetime.datetime.fromtimestamp(stats.st_mtime).strftime('%Y-%m-%d %H:%M:%S')
-
-                    item_info = {
-                        'name': item,
-                        'type': 'file' if os.path.isfile(item_path) else 'folder',
-                        'size': stats.st_size if os.path.isfile(item_path) else None,
-                        'modified': modified_time
-                    }
-                    items.append(item_info)
-                else:
-                    items.append({
-                        'name': item,
-                        'type': 'file' if os.path.isfile(item_path) else 'folder'
-                    })
+        Args:
+            path (str, optional): Directory path. Defaults to current directory.
+            include_details (bool): If True, include file size, modification time
 
-            return items
+        Yields:
+            ListEntry: (name, type, size, modified) for each item
+        """
+        try:
+            yield from self._scan_entries(path, include_details)
         except Exception as e:
             print(f"Error listing items: {e}")
-            return []
+
+    def _scan_entries(self, path, include_details):
+        """
+        Yield a ListEntry for each item in a directory; errors reading the
+        directory propagate to the caller.
+
+        Args:
+            path (str, optional): Directory path. Defaults to current directory.
+            include_details (bool): If True, include file size, modification time
+
+        Yields:
+            ListEntry: (name, type, size, modified) for each item
+        """
+        if path is None:
+            path = self.current_dir
+
+        with os.scandir(path) as it:
+            for entry in it:
+                if include_details:
+                    # One stat per entry provides type, size and mtime
+                    try:
+                        stats = entry.stat()
+                    except OSError:
+                        # Dangling symlink or entry removed since the
+                        # directory read; describe the entry itself
+                        stats = entry.stat(follow_symlinks=False)
+                    else:
+                        if self.stat_cache:
+                            self._cache_stat(self._abspath(entry.path), stats, time.monotonic())
+                    is_file = stat.S_ISREG(stats.st_mode)
+                    modified_time = datetime.datetime.fromtimestamp(stats.st_mtime).isoformat(' ', 'seconds')
+
+                    yield ListEntry(
+                        entry.name,
+                        'file' if is_file else 'folder',
+                        stats.st_size if is_file else None,
+                        modified_time
+                    )
+                else:
+                    # DirEntry caches the type from the directory read,
+                    # so no extra syscalls per item
+                    yield ListEntry(entry.name, 'file' if entry.is_file() else 'folder')
+
+    def walk_files(self, path=None):
+        """
+        Recursively yield the paths of all files under a directory.
+        Symbolic links to directories are not followed.
+
+        Args:
+            path (str, optional): Directory path. Defaults to current directory.
+
+        Yields:
+            str: Path of each file
+        """
+        if path is None:
+            path = self.current_dir
+
+        pending = [path]
+        while pending:
+            directory = pending.pop()
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.is_file():
+                            yield entry.path
+            except OSError as e:
+                print(f"Error listing files in {directory}: {e}")
 
     def get_file_size(self, path):
         """
@@ -252,8 +676,13 @@ class FileSystem:
             int: Size of file in bytes, or -1 if error
         """
         try:
-            if os.path.isfile(path):
-                return os.path.getsize(path)
+            try:
+                st = self._stat(path)
+            except (OSError, ValueError):
+                st = None
+
+            if st is not None and stat.S_ISREG(st.st_mode):
+                return st.st_size
             else:
                 print(f"Error: {path} is not a file")
                 return -1
@@ -273,7 +702,15 @@ class FileSystem:
             bool: True if successful, False otherwise
         """
         try:
-            shutil.copy2(source, destination)
+            if os.path.isdir(destination):
+                destination = os.path.join(destination, os.path.basename(source))
+            self._invalidate_stat(source, destination)
+
+            # Let the kernel copy the data where possible, copy2 otherwise
+            if _HAS_COPY_FILE_RANGE and _copy_file_range(source, destination):
+                shutil.copystat(source, destination)
+            else:
+                shutil.copy2(source, destination)
             return True
         except Exception as e:
             print(f"Error copying file: {e}")
@@ -291,6 +728,12 @@ class FileSystem:
             bool: True if successful, False otherwise
         """
         try:
+            if self._stat_cache and os.path.isdir(source):
+                # Every cached path under the directory moves with it
+                self._stat_cache.clear()
+            elif os.path.isdir(destination):
+                self._invalidate_stat(os.path.join(destination, os.path.basename(source)))
+            self._invalidate_stat(source, destination)
             shutil.move(source, destination)
             return True
         except Exception as e:
@@ -309,18 +752,23 @@ class FileSystem:
             bool: True if successful, False otherwise
         """
         try:
+            if self._stat_cache and os.path.isdir(old_path):
+                # Every cached path under the directory moves with it
+                self._stat_cache.clear()
+            self._invalidate_stat(old_path, new_path)
             os.rename(old_path, new_path)
             return True
         except Exception as e:
             print(f"Error renaming: {e}")
             return False
 
-    def get_drive_space(self, path=None):
+    def get_drive_space(self, path=None, human=True):
         """
         Get drive space information.
 
         Args:
             path (str, optional): Path to check. Defaults to current directory.
+            human (bool): If True, include human-readable size strings
 
         Returns:
             dict: Dictionary with total, used, and free space in bytes
@@ -329,16 +777,18 @@ class FileSystem:
             if path is None:
                 path = self.current_dir
 
-            total, used, free = shutil.disk_usage(path)
-            return {
+            total, used, free = _disk_usage(path)
+            space_info = {
                 'total': total,
-                'total_human': self._human_readable_size(total),
                 'used': used,
-                'used_human': self._human_readable_size(used),
                 'free': free,
-                'free_human': self._human_readable_size(free),
-                'used_percent': round((used / total) * 100, 2)
+                'used_percent': round(used / total * 100, 2) if total else 0
             }
+            if human:
+                space_info['total_human'] = self._human_readable_size(total)
+                space_info['used_human'] = self._human_readable_size(used)
+                space_info['free_human'] = self._human_readable_size(free)
+            return space_info
         except Exception as e:
             print(f"Error getting drive space: {e}")
             return {}
@@ -359,7 +809,7 @@ class FileSystem:
             if self.os_type == 'windows':
                 # Windows-specific approach
                 drives = []
-                bitmask = ctypes.windll.kernel32.GetLogicalDrives() if 'ctypes' in sys.modules else 0
+                bitmask = _GetLogicalDrives() if _GetLogicalDrives else 0
                 for letter in string.ascii_uppercase:
                     if bitmask & 1:
                         drives.append(f"{letter}:")
@@ -367,51 +817,54 @@ class FileSystem:
 
                 for drive in drives:
                     try:
-                        drive_type = ctypes.windll.kernel32.GetDriveTypeW(drive) if 'ctypes' in sys.modules else 0
-                        # 0: Unknown, 1: No root dir, 2: Removable, 3: Fixed, 4: Remote, 5: CDROM, 6: RAMDisk
-                        drive_types = {
-                            0: "UNKNOWN", 1: "NO_ROOT_DIR", 2: "REMOVABLE",
-                            3: "FIXED", 4: "REMOTE", 5: "CDROM", 6: "RAMDISK"
-                        }
+                        drive_type = _GetDriveTypeW(drive) if _GetDriveTypeW else 0
 
-                        fs_type = ""
-                        volume_name = ""
-
-                        # Try to get filesystem type and volume name using WMI or other methods
-                        try:
-                            vol_info = subprocess.check_output(
-                                f"cmd /c vol {drive}",
-                                stderr=subprocess.STDOUT,
-                                universal_newlines=True
-                            )
-                            for line in vol_info.splitlines():
-                                if "Volume in drive" in line and "is" in line:
-                                    volume_name = line.split("is")[1].strip()
-                        except:
-                            pass
+                        volume_info = _get_volume_information(drive) if _GetVolumeInformationW else None
+                        if volume_info:
+                            volume_name, fs_type = volume_info
+                        else:
+                            fs_type = ""
+                            volume_name = ""
 
-                        # Get filesystem type
-                        try:
-                            fs_info = subprocess.check_output(
-                                ["fsutil", "fsinfo", "volumeinfo", drive],
-                                stderr=subprocess.STDOUT,
-                                universal_newlines=True
-                            )
-                            for line in fs_info.splitlines():
-                                if "File System Name" in line:
-                                    fs_type = line.split(":")[1].strip()
-                        except:
-                            pass
+                            # Fall back to the vol and fsutil commands
+                            try:
+                                vol_info = subprocess.check_output(
+                                    f"cmd /c vol {drive}",
+                                    stderr=subprocess.STDOUT,
+                                    universal_newlines=True
+                                )
+                                # The label, if any, is on the first line:
+                                # " Volume in drive C is <label>"
+                                first = vol_info.lstrip().partition('\n')[0]
+                                if first.startswith("Volume in drive"):
+                                    _, sep, label = first.partition(" is ")
+                                    if sep:
+                                        volume_name = label.strip()
+                            except:
+                                pass
+
+                            # Get filesystem type
+                            try:
+                                fs_info = subprocess.check_output(
+                                    ["fsutil", "fsinfo", "volumeinfo", drive],
+                                    stderr=subprocess.STDOUT,
+                                    universal_newlines=True
+                                )
+                                for line in fs_info.splitlines():
+                                    if "File System Name" in line:
+                                        fs_type = line.split(":")[1].strip()
+                            except:
+                                pass
 
                         # Get space information
-                        space_info = self.get_drive_space(drive)
+                        space_info = self.get_drive_space(drive, human=False)
 
                         part_info = {
                             'device': drive,
                             'mountpoint': drive,
                             'fstype': fs_type,
                             'opts': '',
-                            'drive_type': drive_types.get(drive_type, "UNKNOWN"),
+                            'drive_type': _DRIVE_TYPES.get(drive_type, "UNKNOWN"),
                             'volume_name': volume_name,
                             'total_space': space_info.get('total', 0),
                             'free_space': space_info.get('free', 0),
@@ -424,42 +877,41 @@ class FileSystem:
             else:
                 # Unix-like systems (Linux, macOS)
                 try:
-                    mount_output = subprocess.check_output(
-                        ['mount'], stderr=subprocess.STDOUT, universal_newlines=True
-                    )
+                    mounts = None
+                    if self.os_type == 'linux':
+                        # Read the kernel mount table directly instead of running mount
+                        try:
+                            mounts = _read_mountinfo()
+                        except OSError:
+                            pass
+                    if mounts is None:
+                        mounts = _read_mount_command()
 
-                    for line in mount_output.splitlines():
-                        parts = line.split()
-                        if len(parts) >= 5:
-                            device = parts[0]
-                            mountpoint = parts[2]
-                            fstype = parts[4]
-                            opts = parts[5].strip('()')
-
-                            # Skip non-physical devices if requested
-                            if not all_partitions and (
-                                fstype in ('proc', 'sysfs', 'devpts', 'devtmpfs', 'tmpfs') or
-                                device.startswith(('none', '/dev/loop', 'udev'))
-                            ):
-                                continue
-
-                            # Get space information
-                            try:
-                                space_info = self.get_drive_space(mountpoint)
-
-                                part_info = {
-                                    'device': device,
-                                    'mountpoint': mountpoint,
-                                    'fstype': fstype,
-                                    'opts': opts,
-                                    'total_space': space_info.get('total', 0),
-                                    'free_space': space_info.get('free', 0),
-                                    'used_space': space_info.get('used', 0),
-                                    'used_percent': space_info.get('used_percent', 0)
-                                }
-                                partitions.append(part_info)
-                            except Exception as e:
-                                print(f"Error getting space info for {mountpoint}: {e}")
+                    for device, mountpoint, fstype, opts in mounts:
+                        # Skip non-physical devices if requested
+                        if not all_partitions and (
+                            fstype in _SKIP_FSTYPES or
+                            device.startswith(_SKIP_DEVICE_PREFIXES)
+                        ):
+                            continue
+
+                        # Get space information
+                        total = free = used = 0
+                        try:
+                            total, used, free = _disk_usage(mountpoint)
+                        except OSError as e:
+                            print(f"Error getting space info for {mountpoint}: {e}")
+
+                        partitions.append({
+                            'device': device,
+                            'mountpoint': mountpoint,
+                            'fstype': fstype,
+                            'opts': opts,
+                            'total_space': total,
+                            'free_space': free,
+                            'used_space': used,
+                            'used_percent': round(used / total * 100, 2) if total else 0
+                        })
                 except Exception as e:
                     print(f"Error getting mount information: {e}")
 
@@ -483,7 +935,7 @@ class FileSystem:
 
         try:
             # Get basic file system stats
-            stats = os.statvfs(path) if hasattr(os, 'statvfs') else None
+            stats = os.statvfs(path) if _HAS_STATVFS else None
 
             if stats:
                 # Calculate block sizes and counts
@@ -500,13 +952,14 @@ class FileSystem:
                 total_size = total_blocks * fragment_size
                 free_size = free_blocks * fragment_size
                 avail_size = avail_blocks * fragment_size
+                used_size = total_size - free_size
 
                 # Inode usage
                 used_inodes = total_inodes - free_inodes
                 inode_usage_percent = (used_inodes / total_inodes * 100) if total_inodes > 0 else 0
 
                 return {
-                    'path': os.path.abspath(path),
+                    'path': self._abspath(path),
                     'filesystem_stats': {
                         'block_size': stats.f_bsize,
                         'fragment_size': fragment_size,
@@ -527,9 +980,9 @@ class FileSystem:
                         'free_size_human': self._human_readable_size(free_size),
                         'available_size': avail_size,
                         'available_size_human': self._human_readable_size(avail_size),
-                        'used_size': total_size - free_size,
-                        'used_size_human': self._human_readable_size(total_size - free_size),
-                        'usage_percent': ((total_size - free_size) / total_size * 100) if total_size > 0 else 0
+                        'used_size': used_size,
+                        'used_size_human': self._human_readable_size(used_size),
+                        'usage_percent': (used_size / total_size * 100) if total_size > 0 else 0
                     },
                     'inode_usage': {
                         'used_inodes': used_inodes,
@@ -541,7 +994,7 @@ class FileSystem:
                 space_info = self.get_drive_space(path)
 
                 return {
-                    'path': os.path.abspath(path),
+                    'path': self._abspath(path),
                     'space_usage': space_info
                 }
         except Exception as e:
@@ -575,13 +1028,18 @@ class FileSystem:
             print(f"Error changing directory: {e}")
             return False
 
-    def get_file_hash(self, path, hash_type='md5'):
+    def get_file_hash(self, path, hash_type='md5', allow_mmap=True):
         """
         Calculate the hash value of a file.
 
         Args:
             path (str): Path to the file
-            hash_type (str): Hash algorithm to use ('md5', 'sha1', 'sha256')
+            hash_type (str): Hash algorithm to use ('md5', 'sha1', 'sha256',
+                'sha512', 'blake2b', 'blake2s', or 'blake3'/'xxh3' when the
+                blake3/xxhash packages are installed; xxh3 is a fast
+                non-cryptographic hash)
+            allow_mmap (bool): If False, never hash through mmap; a file
+                truncated while mapped raises SIGBUS and ends the process
 
         Returns:
             str: Hash value as hexadecimal string or empty if error
@@ -591,28 +1049,101 @@ class FileSystem:
                 print(f"Error: {path} is not a file")
                 return ""
 
-            hash_funcs = {
-                'md5': hashlib.md5,
-                'sha1': hashlib.sha1,
-                'sha256': hashlib.sha256
-            }
-
-            if hash_type not in hash_funcs:
+            if hash_type in _FAST_HASHES:
+                new_hash = _FAST_HASHES[hash_type]
+            elif hash_type in _HASH_TYPES:
+                new_hash = functools.partial(hashlib.new, hash_type)
+            else:
                 print(f"Error: Unsupported hash type '{hash_type}'")
                 return ""
 
-            hash_obj = hash_funcs[hash_type]()
-
             with open(path, 'rb') as f:
-                # Read file in chunks to handle large files
-                for chunk in iter(lambda: f.read(4096), b''):
-                    hash_obj.update(chunk)
+                st = os.fstat(f.fileno())
+                if _HAS_FILE_DIGEST:
+                    # Python 3.11+: the read/update loop runs in C
+                    hash_obj = hashlib.file_digest(f, new_hash)
+                elif allow_mmap and _HAS_MMAP and st.st_size >= _MMAP_THRESHOLD:
+                    # Hash straight from the page cache without copying
+                    hash_obj = _digest_mmap(f, new_hash())
+                else:
+                    hash_obj = new_hash()
+                    if st.st_size <= _SMALL_FILE_SIZE:
+                        hash_obj.update(f.read())
+                    else:
+                        # Read large files in big chunks into one reusable buffer
+                        bufsize = max(getattr(st, 'st_blksize', 0) * 16, _HASH_BUFSIZE)
+                        view = memoryview(bytearray(bufsize))
+                        while True:
+                            n = f.readinto(view)
+                            if not n:
+                                break
+                            hash_obj.update(view[:n])
 
             return hash_obj.hexdigest()
         except Exception as e:
             print(f"Error calculating file hash: {e}")
             return ""
 
+    def hash_files(self, paths, hash_type='sha256', workers=None):
+        """
+        Calculate the hash values of several files in parallel.
+
+        Args:
+            paths (iterable): Paths of the files to hash
+            hash_type (str): Hash algorithm to use (see get_file_hash)
+            workers (int, optional): Number of worker threads. Defaults to
+                twice the CPU count, capped at 32.
+
+        Returns:
+            list: List of (path, hash) tuples in input order; the hash is an
+                empty string for files that could not be hashed
+        """
+        return list(self.iter_hash_files(paths, hash_type, workers))
+
+    def iter_hash_files(self, paths, hash_type='sha256', workers=None):
+        """
+        Calculate the hash values of several files in parallel, yielding each
+        result as soon as it and every earlier one are done.
+
+        hashlib releases the GIL while hashing, so a thread pool overlaps
+        file I/O and hashing across cores. Only a few files per thread are
+        taken from paths ahead of the output, so a lazy walk stays lazy.
+
+        Args:
+            paths (iterable): Paths of the files to hash
+            hash_type (str): Hash algorithm to use (see get_file_hash)
+            workers (int, optional): Number of worker threads. Defaults to
+                twice the CPU count, capped at 32.
+
+        Yields:
+            tuple: (path, hash) in input order; the hash is an empty string
+                for files that could not be hashed
+        """
+        if workers is None:
+            workers = min(32, (os.cpu_count() or 4) * 2)
+
+        def hash_one(path):
+            # Files in a live tree may be truncated while hashed, so stay off mmap
+            return path, self.get_file_hash(path, hash_type, allow_mmap=False)
+
+        paths = iter(paths)
+        pending = deque()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            try:
+                # Keep a bounded window of files in flight, so the walk and the
+                # futures advance with the output instead of running ahead
+                for path in itertools.islice(paths, workers * _HASH_WINDOW_FACTOR):
+                    pending.append(executor.submit(hash_one, path))
+                while pending:
+                    result = pending.popleft().result()
+                    for path in itertools.islice(paths, 1):
+                        pending.append(executor.submit(hash_one, path))
+                    yield result
+            finally:
+                # Closing this generator early drops the files not yet started
+                for future in pending:
+                    future.cancel()
+
     def get_file_permissions(self, path):
         """
         Get detailed file permissions in both octal and symbolic format.
@@ -624,42 +1155,19 @@ class FileSystem:
             dict: Dictionary containing permission details
         """
         try:
-            if not os.path.exists(path):
+            # Get file stats; a failed stat is the existence check
+            try:
+                st = self._stat(path)
+            except (OSError, ValueError):
                 print(f"Error: {path} does not exist")
                 return {}
 
-            # Get file stats
-            st = os.stat(path)
-
             # Octal permissions (e.g., 0o755)
             mode = st.st_mode
             octal_perm = oct(mode & 0o777)
 
-            # Symbolic permissions (e.g., rwxr-xr-x)
-            symbolic = ''
-
-            # File type prefix
-            if stat.S_ISDIR(mode):
-                symbolic += 'd'
-            elif stat.S_ISLNK(mode):
-                symbolic += 'l'
-            else:
-                symbolic += '-'
-
-            # User permissions
-            symbolic += 'r' if mode & stat.S_IRUSR else '-'
-            symbolic += 'w' if mode & stat.S_IWUSR else '-'
-            symbolic += 'x' if mode & stat.S_IXUSR else '-'
-
-            # Group permissions
-            symbolic += 'r' if mode & stat.S_IRGRP else '-'
-            symbolic += 'w' if mode & stat.S_IWGRP else '-'
-            symbolic += 'x' if mode & stat.S_IXGRP else '-'
-
-            # Other permissions
-            symbolic += 'r' if mode & stat.S_IROTH else '-'
-            symbolic += 'w' if mode & stat.S_IWOTH else '-'
-            symbolic += 'x' if mode & stat.S_IXOTH else '-'
+            # Symbolic permissions (e.g., drwxr-xr-x)
+            symbolic = _TYPE_CHARS.get(stat.S_IFMT(mode), '-') + _PERM_STRINGS[mode & 0o777]
 
             # Additional attributes
             special_bits = {
@@ -669,7 +1177,7 @@ class FileSystem:
             }
 
             return {
-                'path': os.path.abspath(path),
+                'path': self._abspath(path),
                 'octal': octal_perm,
                 'symbolic': symbolic,
                 'special_bits': special_bits,
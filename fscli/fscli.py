@@ -1,29 +1,33 @@
 import argparse
+import contextlib
+import functools
 import sys
-from file_system import FileSystem
-from pretty_print import PrettyPrinter
 
-def main():
+from . import __version__
+
+_HASH_CHOICES = ["md5", "sha1", "sha256", "sha512", "blake2b", "blake2s"]
+
+
+def _positive_int(value):
     """
-    Command-line interface for filesystem operations and forensic analysis.
+    argparse type for options that need a whole number of at least 1.
+
+    Args:
+        value (str): Option value from the command line
+
+    Returns:
+        int: The parsed value
     """
-    parser = argparse.ArgumentParser(
-        description="Filesystem CLI Tool for Operations and Forensic Analysis",
-        formatter_class=argparse.RawDescriptionHelpFormatter
-    )
-    parser.add_argument(
-        "--output",
-        help="Output file for logging results",
-        default=None
-    )
-    parser.add_argument(
-        "--path",
-        help="Path to operate on (default: current directory)",
-        default=None
-    )
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
 
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
+def _add_list_parser(subparsers):
     # List command
     parser_list = subparsers.add_parser("list", help="List files and folders")
     parser_list.add_argument(
@@ -32,9 +36,13 @@ def main():
         help="Include detailed information (size, modified time)"
     )
 
+
+def _add_space_parser(subparsers):
     # Space command
     subparsers.add_parser("space", help="Show drive space information")
 
+
+def _add_partitions_parser(subparsers):
     # Partitions command
     parser_partitions = subparsers.add_parser("partitions", help="Show disk partition information")
     parser_partitions.add_argument(
@@ -43,9 +51,13 @@ def main():
         help="Include all partitions, including virtual ones"
     )
 
+
+def _add_stats_parser(subparsers):
     # Stats command
     subparsers.add_parser("stats", help="Show filesystem statistics")
 
+
+def _add_perms_parser(subparsers):
     # Permissions command
     parser_perms = subparsers.add_parser("perms", help="Show file or folder permissions")
     parser_perms.add_argument(
@@ -53,6 +65,8 @@ def main():
         help="File or folder to check permissions for"
     )
 
+
+def _add_hash_parser(subparsers):
     # Hash command
     parser_hash = subparsers.add_parser("hash", help="Calculate file hash")
     parser_hash.add_argument(
@@ -61,11 +75,32 @@ def main():
     )
     parser_hash.add_argument(
         "--type",
-        choices=["md5", "sha1", "sha256"],
+        choices=_HASH_CHOICES,
+        default="sha256",
+        help="Hash algorithm to use (default: sha256)"
+    )
+
+
+def _add_hash_tree_parser(subparsers):
+    # Hash tree command
+    parser_hash_tree = subparsers.add_parser(
+        "hash-tree", help="Calculate hashes of all files under a directory"
+    )
+    parser_hash_tree.add_argument(
+        "--type",
+        choices=_HASH_CHOICES,
         default="sha256",
         help="Hash algorithm to use (default: sha256)"
     )
+    parser_hash_tree.add_argument(
+        "--jobs",
+        type=_positive_int,
+        default=None,
+        help="Number of files to hash in parallel (default: twice the CPU count, up to 32)"
+    )
+
 
+def _add_create_file_parser(subparsers):
     # Create file command
     parser_create_file = subparsers.add_parser("create-file", help="Create a new file")
     parser_create_file.add_argument(
@@ -78,6 +113,8 @@ def main():
         help="Content to write to the file (default: empty)"
     )
 
+
+def _add_create_folder_parser(subparsers):
     # Create folder command
     parser_create_folder = subparsers.add_parser("create-folder", help="Create a new folder")
     parser_create_folder.add_argument(
@@ -85,6 +122,8 @@ def main():
         help="Path of the folder to create"
     )
 
+
+def _add_delete_parser(subparsers):
     # Delete command
     parser_delete = subparsers.add_parser("delete", help="Delete a file or folder")
     parser_delete.add_argument(
@@ -97,6 +136,8 @@ def main():
         help="Recursively delete folder and its contents"
     )
 
+
+def _add_copy_parser(subparsers):
     # Copy command
     parser_copy = subparsers.add_parser("copy", help="Copy a file")
     parser_copy.add_argument(
@@ -108,6 +149,8 @@ def main():
         help="Destination file path"
     )
 
+
+def _add_move_parser(subparsers):
     # Move command
     parser_move = subparsers.add_parser("move", help="Move a file")
     parser_move.add_argument(
@@ -119,6 +162,8 @@ def main():
         help="Destination file path"
     )
 
+
+def _add_rename_parser(subparsers):
     # Rename command
     parser_rename = subparsers.add_parser("rename", help="Rename a file or folder")
     parser_rename.add_argument(
@@ -130,6 +175,8 @@ def main():
         help="New path"
     )
 
+
+def _add_cd_parser(subparsers):
     # Change directory command
     parser_cd = subparsers.add_parser("cd", help="Change current directory")
     parser_cd.add_argument(
@@ -137,56 +184,305 @@ def main():
         help="New directory path"
     )
 
-    args = parser.parse_args()
+
+# Subcommand parser builders, in the order they appear in --help
+_SUBPARSERS = {
+    "list": _add_list_parser,
+    "space": _add_space_parser,
+    "partitions": _add_partitions_parser,
+    "stats": _add_stats_parser,
+    "perms": _add_perms_parser,
+    "hash": _add_hash_parser,
+    "hash-tree": _add_hash_tree_parser,
+    "create-file": _add_create_file_parser,
+    "create-folder": _add_create_folder_parser,
+    "delete": _add_delete_parser,
+    "copy": _add_copy_parser,
+    "move": _add_move_parser,
+    "rename": _add_rename_parser,
+    "cd": _add_cd_parser,
+}
+
+
+def _json_dumps():
+    """
+    Pick the JSON encoder for --format json/ndjson: orjson if it is installed,
+    otherwise the standard library with compact separators.
+
+    Returns:
+        callable: Function encoding an object to a JSON string
+    """
+    import json
+
+    def dumps(obj):
+        return json.dumps(obj, separators=(",", ":"), default=str)
+
+    try:
+        import orjson
+    except ImportError:
+        return dumps
+
+    def orjson_dumps(obj):
+        try:
+            return orjson.dumps(obj, default=str).decode()
+        except orjson.JSONEncodeError:
+            # orjson rejects strings the standard library can escape, such
+            # as undecodable file names
+            return dumps(obj)
+
+    return orjson_dumps
+
+
+def _write_json(printer, data, fmt):
+    """
+    Write command results as JSON instead of a formatted report. The text goes
+    through the printer unformatted, so --output still receives a copy.
+
+    Args:
+        printer (PrettyPrinter): Printer whose console and file sinks to use
+        data: A dict, or an iterable of dicts
+        fmt (str): "json" for a single document, "ndjson" for one line per record
+    """
+    dumps = _json_dumps()
+    write = printer.write_text
+    if isinstance(data, dict):
+        write(dumps(data) + "\n")
+    elif fmt == "ndjson":
+        # Records are encoded as they arrive, so nothing is held in memory
+        for record in data:
+            write(dumps(record) + "\n")
+    else:
+        write(dumps(list(data)) + "\n")
+
+
+def _cmd_list(fs, printer, args):
+    items = fs.iter_all(path=args.path, include_details=args.detailed)
+    if args.format != "table":
+        _write_json(printer, (item._asdict() for item in items), args.format)
+        return
+    printer.print_list_streaming("Directory Listing", items, detailed=args.detailed)
+
+
+def _cmd_space(fs, printer, args):
+    space_info = fs.get_drive_space(path=args.path)
+    if args.format != "table":
+        _write_json(printer, space_info, args.format)
+        return
+    printer.print_drive_space("Drive Space Information", space_info)
+
+
+def _cmd_partitions(fs, printer, args):
+    partitions = fs.get_disk_partitions(all_partitions=args.all)
+    if args.format != "table":
+        _write_json(printer, partitions, args.format)
+        return
+    printer.print_partitions("Disk Partitions", partitions)
+
+
+def _cmd_stats(fs, printer, args):
+    stats = fs.get_filesystem_stats(path=args.path)
+    if args.format != "table":
+        _write_json(printer, stats, args.format)
+        return
+    printer.print_filesystem_stats("Filesystem Statistics", stats)
+
+
+def _cmd_perms(fs, printer, args):
+    perms = fs.get_file_permissions(args.target)
+    if args.format != "table":
+        _write_json(printer, perms, args.format)
+        return
+    printer.print_file_permissions(f"Permissions for {args.target}", perms)
+
+
+def _cmd_hash(fs, printer, args):
+    hash_value = fs.get_file_hash(args.file, hash_type=args.type)
+    if args.format != "table":
+        _write_json(printer, {"path": args.file, "type": args.type, "hash": hash_value}, args.format)
+        return
+    printer.print_file_hash(f"Hash for {args.file}", hash_value, args.type)
+
+
+def _cmd_hash_tree(fs, printer, args):
+    hashes = fs.iter_hash_files(fs.walk_files(args.path), hash_type=args.type, workers=args.jobs)
+    if args.format != "table":
+        # Files that could not be hashed keep an empty hash, as in the hash command
+        records = ({"path": path, "type": args.type, "hash": hash_value}
+                   for path, hash_value in hashes)
+        _write_json(printer, records, args.format)
+        return
+    printer.print_file_hashes("File Hashes", hashes, args.type)
+
+
+def _cmd_create_file(fs, printer, args):
+    success = fs.create_file(args.file, content=args.content)
+    print(f"File creation {'successful' if success else 'failed'}: {args.file}")
+
+
+def _cmd_create_folder(fs, printer, args):
+    success = fs.create_folder(args.folder)
+    print(f"Folder creation {'successful' if success else 'failed'}: {args.folder}")
+
+
+def _cmd_delete(fs, printer, args):
+    if fs.delete_file(args.path) or fs.delete_folder(args.path, recursive=args.recursive):
+        print(f"Deletion successful: {args.path}")
+    else:
+        print(f"Deletion failed: {args.path}")
+
+
+def _cmd_copy(fs, printer, args):
+    success = fs.copy_file(args.source, args.destination)
+    print(f"File copy {'successful' if success else 'failed'}: {args.source} to {args.destination}")
+
+
+def _cmd_move(fs, printer, args):
+    success = fs.move_file(args.source, args.destination)
+    print(f"File move {'successful' if success else 'failed'}: {args.source} to {args.destination}")
+
+
+def _cmd_rename(fs, printer, args):
+    success = fs.rename(args.old_path, args.new_path)
+    print(f"Rename {'successful' if success else 'failed'}: {args.old_path} to {args.new_path}")
+
+
+def _cmd_cd(fs, printer, args):
+    success = fs.change_directory(args.path)
+    print(f"Directory change {'successful' if success else 'failed'}: {args.path}")
+
+
+# Subcommand handlers, called as handler(fs, printer, args)
+_COMMANDS = {
+    "list": _cmd_list,
+    "space": _cmd_space,
+    "partitions": _cmd_partitions,
+    "stats": _cmd_stats,
+    "perms": _cmd_perms,
+    "hash": _cmd_hash,
+    "hash-tree": _cmd_hash_tree,
+    "create-file": _cmd_create_file,
+    "create-folder": _cmd_create_folder,
+    "delete": _cmd_delete,
+    "copy": _cmd_copy,
+    "move": _cmd_move,
+    "rename": _cmd_rename,
+    "cd": _cmd_cd,
+}
+
+# Commands that honour --format json/ndjson
+_JSON_COMMANDS = frozenset({"list", "space", "partitions", "stats", "perms", "hash", "hash-tree"})
+
+# Root options that take a value, so the value isn't mistaken for a command
+_ROOT_VALUE_OPTIONS = ("--output", "--path", "--format")
+
+
+def _sniff_command(argv):
+    """
+    Find the subcommand name in the arguments without a full parse.
+
+    Args:
+        argv (list): Command-line arguments, without the program name
+
+    Returns:
+        str: The first positional argument, or None if there is none
+    """
+    args = iter(argv)
+    for arg in args:
+        if arg.startswith("--") and arg != "--" and "=" not in arg:
+            # argparse also accepts unambiguous abbreviations such as --out
+            if any(opt.startswith(arg) for opt in _ROOT_VALUE_OPTIONS):
+                next(args, None)
+        elif not arg.startswith("-"):
+            return arg
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _build_parser(command=None, subcommands=True):
+    """
+    Build the argument parser, cached so repeated calls in one process reuse it.
+
+    Args:
+        command (str, optional): Only add the parser for this subcommand;
+            None adds all of them
+        subcommands (bool): If False, add no subcommands at all
+
+    Returns:
+        argparse.ArgumentParser: The parser
+    """
+    parser = argparse.ArgumentParser(
+        description="Filesystem CLI Tool for Operations and Forensic Analysis",
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--version",
+        action="version",
+        version=f"%(prog)s {__version__}"
+    )
+    parser.add_argument(
+        "--output",
+        help="Output file for logging results",
+        default=None
+    )
+    parser.add_argument(
+        "--path",
+        help="Path to operate on (default: current directory)",
+        default=None
+    )
+    parser.add_argument(
+        "--format",
+        choices=["table", "json", "ndjson"],
+        default="table",
+        help="Output format for reports (default: table)"
+    )
+
+    if subcommands:
+        subparsers = parser.add_subparsers(dest="command", help="Available commands")
+        if command is not None:
+            _SUBPARSERS[command](subparsers)
+        else:
+            for add_parser in _SUBPARSERS.values():
+                add_parser(subparsers)
+
+    return parser
+
+
+def main():
+    """
+    Command-line interface for filesystem operations and forensic analysis.
+    """
+    argv = sys.argv[1:]
+
+    # Only build the parser of the command being run; help, errors and
+    # unknown commands get all of them so usage messages stay complete.
+    # A bare --version needs no subcommands at all.
+    command = _sniff_command(argv)
+    parser = _build_parser(
+        command if command in _SUBPARSERS else None,
+        command is not None or "--version" not in argv
+    )
+
+    args = parser.parse_args(argv)
 
     if not args.command:
         parser.print_help()
         sys.exit(1)
 
+    # Deferred so --help, --version and usage errors skip these imports
+    from .file_system import FileSystem
+    from .pretty_print import PrettyPrinter
+
     fs = FileSystem()
-    printer = PrettyPrinter(output_file=args.output)
-
-    if args.command == "list":
-        items = fs.list_all(path=args.path, include_details=args.detailed)
-        printer.print_list("Directory Listing", items, detailed=args.detailed)
-    elif args.command == "space":
-        space_info = fs.get_drive_space(path=args.path)
-        printer.print_drive_space("Drive Space Information", space_info)
-    elif args.command == "partitions":
-        partitions = fs.get_disk_partitions(all_partitions=args.all)
-        printer.print_partitions("Disk Partitions", partitions)
-    elif args.command == "stats":
-        stats = fs.get_filesystem_stats(path=args.path)
-        printer.print_filesystem_stats("Filesystem Statistics", stats)
-    elif args.command == "perms":
-        perms = fs.get_file_permissions(args.target)
-        printer.print_file_permissions(f"Permissions for {args.target}", perms)
-    elif args.command == "hash":
-        hash_value = fs.get_file_hash(args.file, hash_type=args.type)
-        printer.print_file_hash(f"Hash for {args.file}", hash_value, args.type)
-    elif args.command == "create-file":
-        success = fs.create_file(args.file, content=args.content)
-        print(f"File creation {'successful' if success else 'failed'}: {args.file}")
-    elif args.command == "create-folder":
-        success = fs.create_folder(args.folder)
-        print(f"Folder creation {'successful' if success else 'failed'}: {args.folder}")
-    elif args.command == "delete":
-        if fs.delete_file(args.path) or fs.delete_folder(args.path, recursive=args.recursive):
-            print(f"Deletion successful: {args.path}")
+    with PrettyPrinter(output_file=args.output) as printer:
+        if args.format != "table" and args.command in _JSON_COMMANDS:
+            # FileSystem reports errors with print(); send them to stderr so
+            # stdout stays valid JSON. The printer bound the real stdout when
+            # it was created, so its output is unaffected.
+            with contextlib.redirect_stdout(sys.stderr):
+                _COMMANDS[args.command](fs, printer, args)
         else:
-            print(f"Deletion failed: {args.path}")
-    elif args.command == "copy":
-        success = fs.copy_file(args.source, args.destination)
-        print(f"File copy {'successful' if success else 'failed'}: {args.source} to {args.destination}")
-    elif args.command == "move":
-        success = fs.move_file(args.source, args.destination)
-        print(f"File move {'successful' if success else 'failed'}: {args.source} to {args.destination}")
-    elif args.command == "rename":
-        success = fs.rename(args.old_path, args.new_path)
-        print(f"Rename {'successful' if success else 'failed'}: {args.old_path} to {args.new_path}")
-    elif args.command == "cd":
-        success = fs.change_directory(args.path)
-        print(f"Directory change {'successful' if success else 'failed'}: {args.path}")
+            _COMMANDS[args.command](fs, printer, args)
+
 
 if __name__ == "__main__":
     main()
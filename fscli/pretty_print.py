@@ -1,6 +1,80 @@
 import sys
+import itertools
+import queue
+import tempfile
+import threading
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Tuple, Callable
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+# Column headers of a detailed list
+_LIST_HEADERS = ('Name', 'Type', 'Size', 'Modified')
+
+# Formatted sizes by byte count; listings repeat a few sizes many times
+_SIZE_CACHE = {}
+_SIZE_CACHE_MAX = 4096
+
+# Lines written per batch when streaming a list
+_STREAM_BATCH = 1024
+
+# Streamed rows are spooled to memory up to this size, then to a temporary file
+_SPOOL_MAX_SIZE = 1 << 20
+
+# Writes queued for the output file before report output waits for the disk
+_WRITE_QUEUE_SIZE = 256
+
+# Separators for spooled rows: a unit separator between fields, and NUL, which
+# can't appear in a file name, between rows
+_FIELD_SEP = '\x1f'
+_ROW_SEP = '\0'
+
+
+def _read_rows(f, chunk_size=1 << 16):
+    """
+    Yield the NUL-terminated rows of a binary file as lists of fields.
+
+    Args:
+        f: Binary file positioned at the first row.
+        chunk_size (int): Number of bytes to read at a time.
+
+    Yields:
+        List[str]: Fields of each row.
+    """
+    row_sep = _ROW_SEP.encode()
+    tail = b''
+    for chunk in iter(lambda: f.read(chunk_size), b''):
+        rows = (tail + chunk).split(row_sep)
+        tail = rows.pop()
+        for row in rows:
+            yield row.decode('utf-8', 'surrogateescape').split(_FIELD_SEP)
+
+
+def _item_name(item):
+    """
+    Get the text shown for an item in a simple list.
+
+    Args:
+        item (Any): String or ListEntry tuple.
+
+    Returns:
+        str: The item's name.
+    """
+    return item.name if isinstance(item, tuple) else str(item)
+
+
+def _widen(widths, cells):
+    """
+    Grow column widths to fit a row of cells.
+
+    Args:
+        widths (List[int]): Column widths, updated in place.
+        cells (Tuple[str, ...]): Cells of one row.
+    """
+    for i, cell in enumerate(cells):
+        if len(cell) > widths[i]:
+            widths[i] = len(cell)
+
 
 class PrettyPrinter:
     """
@@ -20,6 +94,66 @@ class PrettyPrinter:
         self.width = width
         self.border_char = "="
         self.section_char = "-"
+        self._out = sys.stdout.write
+
+        # Borders and the report timestamp are the same for every section
+        self._border = self.border_char * width
+        self._section = self.section_char * width
+        self._timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+        # Keep one buffered handle open instead of reopening per line, and
+        # write to it from a background thread so a slow disk doesn't hold up
+        # the console output; the queue is bounded, so once the file falls
+        # _WRITE_QUEUE_SIZE writes behind, output waits instead of piling up
+        self._fh = None
+        self._queue = None
+        self._writer = None
+        if output_file:
+            try:
+                self._fh = open(output_file, 'a', buffering=1 << 16)
+            except Exception as e:
+                print(f"Error opening output file: {e}")
+            else:
+                self._queue = queue.Queue(maxsize=_WRITE_QUEUE_SIZE)
+                self._writer = threading.Thread(target=self._drain, name="PrettyPrinter-writer", daemon=True)
+                self._writer.start()
+
+    def __enter__(self) -> "PrettyPrinter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Flush and close the output file, if any.
+        """
+        if self._writer is not None:
+            # Let the writer finish everything queued so far
+            self._queue.put(None)
+            self._writer.join()
+            self._writer = None
+            self._queue = None
+        if self._fh is not None:
+            try:
+                self._fh.close()
+            except Exception as e:
+                print(f"Error writing to output file: {e}")
+            self._fh = None
+
+    def _drain(self) -> None:
+        """
+        Write queued text to the output file until a None sentinel arrives.
+        Runs on the writer thread.
+        """
+        while True:
+            text = self._queue.get()
+            if text is None:
+                return
+            try:
+                self._fh.write(text)
+            except Exception as e:
+                print(f"Error writing to output file: {e}")
 
     def _write_output(self, text: str) -> None:
         """
@@ -28,13 +162,30 @@ class PrettyPrinter:
         Args:
             text (str): Text to output.
         """
-        print(text)
-        if self.output_file:
-            try:
-                with open(self.output_file, 'a') as f:
-                    f.write(text + '\n')
-            except Exception as e:
-                print(f"Error writing to output file: {e}")
+        self._out(text)
+        self._out('\n')
+        if self._queue is not None:
+            self._queue.put(text + '\n')
+
+    def _write_many(self, lines: List[str]) -> None:
+        """
+        Write several lines to both console and optional output file at once.
+
+        Args:
+            lines (List[str]): Lines to output.
+        """
+        self.write_text("\n".join(lines) + "\n")
+
+    def write_text(self, text: str) -> None:
+        """
+        Write preformatted text, unchanged, to both console and optional output file.
+
+        Args:
+            text (str): Text to output, including any trailing newline.
+        """
+        self._out(text)
+        if self._queue is not None:
+            self._queue.put(text)
 
     def print_header(self, title: str) -> None:
         """
@@ -43,9 +194,7 @@ class PrettyPrinter:
         Args:
             title (str): Header title.
         """
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        header = f"\n{self.border_char * self.width}\n{title}\nTimestamp: {timestamp}\n{self.border_char * self.width}"
-        self._write_output(header)
+        self._write_output(f"\n{self._border}\n{title}\nTimestamp: {self._timestamp}\n{self._border}")
 
     def print_list(self, title: str, items: List[Any], detailed: bool = False) -> None:
         """
@@ -53,39 +202,113 @@ class PrettyPrinter:
 
         Args:
             title (str): Title for the list section.
-            items (List[Any]): List of items to print (strings or dictionaries).
-            detailed (bool): If True, expect dictionaries with detailed info.
+            items (List[Any]): List of items to print (strings or ListEntry tuples).
+            detailed (bool): If True, expect ListEntry tuples with detailed info.
         """
         self.print_header(title)
         if not items:
             self._write_output("No items found.")
             return
 
-        if detailed and isinstance(items[0], dict):
-            # Determine column widths for detailed output
-            headers = ['Name', 'Type', 'Size', 'Modified']
-            max_name = max(len(item['name']) for item in items)
-            max_type = max(len(item['type']) for item in items)
-            max_size = max(len(self._format_size(item.get('size', 0))) for item in items)
-            max_modified = max(len(item.get('modified', '')) for item in items)
-
-            # Print header
-            header = (f"{'Name':<{max_name}}  {'Type':<{max_type}}  "
-                     f"{'Size':<{max_size}}  {'Modified':<{max_modified}}")
-            self._write_output(header)
-            self._write_output(self.section_char * self.width)
-
-            # Print items
+        if detailed and isinstance(items[0], tuple):
+            # Format every cell and find the column widths in one pass
+            rows = []
+            widths = [0] * len(_LIST_HEADERS)
             for item in items:
-                size = self._format_size(item.get('size', 0)) if item.get('size') else 'N/A'
-                modified = item.get('modified', 'N/A')
-                row = (f"{item['name']:<{max_name}}  {item['type']:<{max_type}}  "
-                       f"{size:<{max_size}}  {modified:<{max_modified}}")
-                self._write_output(row)
+                cells = self._list_cells(item)
+                rows.append(cells)
+                _widen(widths, cells)
+
+            # Header, then one row per item
+            row_fmt, out = self._list_table(widths)
+            out.extend(row_fmt(*cells) for cells in rows)
+            self._write_many(out)
         else:
             # Simple list output
+            self._write_many([_item_name(item) for item in items])
+
+    def print_list_streaming(self, title: str, items: Iterable[Any], detailed: bool = False) -> None:
+        """
+        Print a formatted list of items from an iterable, as print_list does,
+        without holding every item in memory. Detailed rows are spooled to a
+        temporary file while the column widths are measured, then read back
+        and padded.
+
+        Args:
+            title (str): Title for the list section.
+            items (Iterable[Any]): Items to print (strings or ListEntry tuples).
+            detailed (bool): If True, expect ListEntry tuples with detailed info.
+        """
+        self.print_header(title)
+        items = iter(items)
+
+        if not detailed:
+            # Simple list output, written a batch at a time
+            count = 0
+            for batch in iter(lambda: list(itertools.islice(items, _STREAM_BATCH)), []):
+                self._write_many([_item_name(item) for item in batch])
+                count += len(batch)
+            if not count:
+                self._write_output("No items found.")
+            return
+
+        with tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_SIZE, mode='w+b') as spool:
+            # First pass: spool the formatted cells and find the column widths
+            count = 0
+            widths = [0] * len(_LIST_HEADERS)
             for item in items:
-                self._write_output(str(item))
+                cells = self._list_cells(item)
+                row = _FIELD_SEP.join(cells) + _ROW_SEP
+                spool.write(row.encode('utf-8', 'surrogateescape'))
+                count += 1
+                _widen(widths, cells)
+
+            if not count:
+                self._write_output("No items found.")
+                return
+
+            # Second pass: header, then the padded rows a batch at a time
+            spool.seek(0)
+            row_fmt, out = self._list_table(widths)
+            for row in _read_rows(spool):
+                # Only the name can contain the field separator
+                out.append(row_fmt(_FIELD_SEP.join(row[:-3]), *row[-3:]))
+                if len(out) >= _STREAM_BATCH:
+                    self._write_many(out)
+                    out = []
+            if out:
+                self._write_many(out)
+
+    def _list_cells(self, item: Any) -> Tuple[str, str, str, str]:
+        """
+        Format the cells of one detailed list row.
+
+        Args:
+            item (Any): ListEntry tuple.
+
+        Returns:
+            Tuple[str, str, str, str]: Name, type, size and modified cells.
+        """
+        return (
+            item.name,
+            item.type,
+            self._format_size(item.size) if item.size else 'N/A',
+            item.modified or 'N/A'
+        )
+
+    def _list_table(self, widths: List[int]) -> Tuple[Callable[..., str], List[str]]:
+        """
+        Start a detailed list table with the given column widths.
+
+        Args:
+            widths (List[int]): Width of each column.
+
+        Returns:
+            Tuple[Callable[..., str], List[str]]: Function padding a row's cells
+                into a line, and the header and separator lines.
+        """
+        row_fmt = "  ".join("{:<%d}" % w for w in widths).format
+        return row_fmt, [row_fmt(*_LIST_HEADERS), self._section]
 
     def _format_size(self, size: int) -> str:
         """
@@ -99,13 +322,15 @@ class PrettyPrinter:
         """
         if size == -1 or size is None:
             return 'N/A'
-        units = ['B', 'KB', 'MB', 'GB', 'TB', 'PB']
-        size = float(size)
-        unit_index = 0
-        while size >= 1024 and unit_index < len(units) - 1:
-            size /= 1024
-            unit_index += 1
-        return f"{size:.2f} {units[unit_index]}"
+        result = _SIZE_CACHE.get(size)
+        if result is not None:
+            return result
+        # Each unit step is 10 bits, so the bit length picks the unit directly
+        unit_index = min(max((int(size).bit_length() - 1) // 10, 0), len(_SIZE_UNITS) - 1)
+        result = f"{size / (1 << (unit_index * 10)):.2f} {_SIZE_UNITS[unit_index]}"
+        if len(_SIZE_CACHE) < _SIZE_CACHE_MAX:
+            _SIZE_CACHE[size] = result
+        return result
 
     def print_drive_space(self, title: str, space_info: Dict[str, Any]) -> None:
         """
@@ -128,8 +353,8 @@ class PrettyPrinter:
         ]
 
         max_label = max(len(label) for label, _ in fields)
-        for label, value in fields:
-            self._write_output(f"{label:<{max_label}}: {value}")
+        row = ("{:<%d}: {}" % max_label).format
+        self._write_many([row(label, value) for label, value in fields])
 
     def print_partitions(self, title: str, partitions: List[Dict[str, Any]]) -> None:
         """
@@ -144,35 +369,31 @@ class PrettyPrinter:
             self._write_output("No partition information available.")
             return
 
-        headers = ['Device', 'Mountpoint', 'FSType', 'Drive Type', 'Volume Name', 'Used %']
-        max_lengths = {h: len(h) for h in headers}
-        for part in partitions:
-            max_lengths['Device'] = max(max_lengths['Device'], len(part.get('device', '')))
-            max_lengths['Mountpoint'] = max(max_lengths['Mountpoint'], len(part.get('mountpoint', '')))
-            max_lengths['FSType'] = max(max_lengths['FSType'], len(part.get('fstype', '')))
-            max_lengths['Drive Type'] = max(max_lengths['Drive Type'], len(part.get('drive_type', '')))
-            max_lengths['Volume Name'] = max(max_lengths['Volume Name'], len(part.get('volume_name', '')))
-            max_lengths['Used %'] = max(max_lengths['Used %'], len(f"{part.get('used_percent', 0):.2f}%"))
-
-        # Print header
-        header = (f"{'Device':<{max_lengths['Device']}}  "
-                  f"{'Mountpoint':<{max_lengths['Mountpoint']}}  "
-                  f"{'FSType':<{max_lengths['FSType']}}  "
-                  f"{'Drive Type':<{max_lengths['Drive Type']}}  "
-                  f"{'Volume Name':<{max_lengths['Volume Name']}}  "
-                  f"{'Used %':<{max_lengths['Used %']}}")
-        self._write_output(header)
-        self._write_output(self.section_char * self.width)
-
-        # Print partitions
+        headers = ('Device', 'Mountpoint', 'FSType', 'Drive Type', 'Volume Name', 'Used %')
+
+        # Format every cell and find the column widths in one pass
+        rows = []
+        widths = [len(h) for h in headers]
         for part in partitions:
-            row = (f"{part.get('device', 'N/A'):<{max_lengths['Device']}}  "
-                   f"{part.get('mountpoint', 'N/A'):<{max_lengths['Mountpoint']}}  "
-                   f"{part.get('fstype', 'N/A'):<{max_lengths['FSType']}}  "
-                   f"{part.get('drive_type', 'N/A'):<{max_lengths['Drive Type']}}  "
-                   f"{part.get('volume_name', 'N/A'):<{max_lengths['Volume Name']}}  "
-                   f"{part.get('used_percent', 0):.2f}%:<{max_lengths['Used %']}")
-            self._write_output(row)
+            get = part.get
+            row = (
+                get('device', 'N/A'),
+                get('mountpoint', 'N/A'),
+                get('fstype', 'N/A'),
+                get('drive_type', 'N/A'),
+                get('volume_name', 'N/A'),
+                f"{get('used_percent', 0):.2f}%"
+            )
+            rows.append(row)
+            for i, cell in enumerate(row):
+                if len(cell) > widths[i]:
+                    widths[i] = len(cell)
+
+        # Header, then one row per partition
+        row_fmt = "  ".join("{:<%d}" % w for w in widths).format
+        out = [row_fmt(*headers), self._section]
+        out.extend(row_fmt(*row) for row in rows)
+        self._write_many(out)
 
     def print_filesystem_stats(self, title: str, stats: Dict[str, Any]) -> None:
         """
@@ -187,12 +408,11 @@ class PrettyPrinter:
             self._write_output("No filesystem statistics available.")
             return
 
-        self._write_output(f"Path: {stats.get('path', 'N/A')}")
-        self._write_output(self.section_char * self.width)
+        out = [f"Path: {stats.get('path', 'N/A')}", self._section]
 
         # Space Usage
         if 'space_usage' in stats:
-            self._write_output("Space Usage:")
+            out.append("Space Usage:")
             space = stats['space_usage']
             fields = [
                 ('Total Size', space.get('total_size_human', 'N/A')),
@@ -202,12 +422,12 @@ class PrettyPrinter:
                 ('Usage Percent', f"{space.get('usage_percent', 0):.2f}%")
             ]
             max_label = max(len(label) for label, _ in fields)
-            for label, value in fields:
-                self._write_output(f"  {label:<{max_label}}: {value}")
+            row = ("  {:<%d}: {}" % max_label).format
+            out.extend(row(label, value) for label, value in fields)
 
         # Filesystem Stats
         if 'filesystem_stats' in stats:
-            self._write_output("\nFilesystem Stats:")
+            out.append("\nFilesystem Stats:")
             fs_stats = stats['filesystem_stats']
             fields = [
                 ('Block Size', f"{fs_stats.get('block_size', 'N/A')} bytes"),
@@ -222,20 +442,22 @@ class PrettyPrinter:
                 ('Maximum Filename Length', fs_stats.get('maximum_filename_length', 'N/A'))
             ]
             max_label = max(len(label) for label, _ in fields)
-            for label, value in fields:
-                self._write_output(f"  {label:<{max_label}}: {value}")
+            row = ("  {:<%d}: {}" % max_label).format
+            out.extend(row(label, value) for label, value in fields)
 
         # Inode Usage
         if 'inode_usage' in stats:
-            self._write_output("\nInode Usage:")
+            out.append("\nInode Usage:")
             inode = stats['inode_usage']
             fields = [
                 ('Used Inodes', inode.get('used_inodes', 'N/A')),
                 ('Usage Percent', f"{inode.get('usage_percent', 0):.2f}%")
             ]
             max_label = max(len(label) for label, _ in fields)
-            for label, value in fields:
-                self._write_output(f"  {label:<{max_label}}: {value}")
+            row = ("  {:<%d}: {}" % max_label).format
+            out.extend(row(label, value) for label, value in fields)
+
+        self._write_many(out)
 
     def print_file_permissions(self, title: str, perms: Dict[str, Any]) -> None:
         """
@@ -262,8 +484,8 @@ class PrettyPrinter:
         ]
 
         max_label = max(len(label) for label, _ in fields)
-        for label, value in fields:
-            self._write_output(f"{label:<{max_label}}: {value}")
+        row = ("{:<%d}: {}" % max_label).format
+        self._write_many([row(label, value) for label, value in fields])
 
     def print_file_hash(self, title: str, hash_value: str, hash_type: str) -> None:
         """
@@ -280,12 +502,30 @@ class PrettyPrinter:
             return
         self._write_output(f"{hash_type.upper()} Hash: {hash_value}")
 
+    def print_file_hashes(self, title: str, hashes: Iterable[Any], hash_type: str) -> None:
+        """
+        Print hash values for several files, one "<hash>  <path>" line each,
+        writing each line as soon as its hash arrives.
 
+        Args:
+            title (str): Title for the hash section.
+            hashes (Iterable[Any]): (path, hash value) tuples; entries with an
+                empty hash value are skipped.
+            hash_type (str): Type of hash (e.g., 'md5', 'sha256').
+        """
+        self.print_header(f"{title} ({hash_type.upper()})")
+        count = 0
+        for path, hash_value in hashes:
+            if hash_value:
+                self._write_output(f"{hash_value}  {path}")
+                count += 1
+        if not count:
+            self._write_output("No hash values available.")
 
-from file_system import FileSystem
-from pretty_print import PrettyPrinter
 
 if __name__ == "__main__":
+    from file_system import FileSystem
+
     # Example usage
     fs = FileSystem()
     printer = PrettyPrinter(output_file="filesystem_log.txt")
@@ -313,3 +553,5 @@ if __name__ == "__main__":
     # Get and print file hash
     hash_value = fs.get_file_hash("example.txt", hash_type="sha256")
     printer.print_file_hash("File Hash", hash_value, "sha256")
+
+    printer.close()